@@ -7,12 +7,35 @@ but powerful concept: "cellular automata" where the state of a "cell"
 This is a fundamental technique used in computer graphics, simulations, and art.
 
 We'll be using the `pygame` library for drawing, which is excellent for
-interactive graphics and games. Make sure you have it installed:
-`pip install pygame`
+interactive graphics and games, and `numpy` to store the grid as a compact
+array and update every cell at once. Make sure you have them installed:
+`pip install pygame numpy`
+
+Optionally, install `numba` (`pip install numba`) to enable the compiled
+"numba" backend, which updates the grid with a single fused, compiled loop
+running on all CPU cores. With an NVIDIA GPU, install `cupy` to enable the
+"cupy" backend, which keeps the whole grid on the graphics card.
+To compare backends on your machine, run e.g.
+`CA_BACKEND=numba CA_BENCHMARK_STEPS=1000 python python_guide_b8f2c6.py`.
 """
 
-import pygame
+import os
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; only the "numba" backend needs it.
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # cupy is optional; only the "cupy" backend needs it.
+    cp = None
 
 # --- Configuration ---
 # Define the dimensions of our display window.
@@ -20,6 +43,15 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 # Define the size of each "cell" in our simulation.
 CELL_SIZE = 5
+# How many frames are drawn per second, and how many generations are computed per frame.
+# Raise STEPS_PER_FRAME to make the patterns evolve faster without drawing more often.
+FRAME_RATE = 30
+STEPS_PER_FRAME = 1
+# Which backend computes the generations (see BACKENDS), e.g. CA_BACKEND=numba.
+BACKEND = os.environ.get("CA_BACKEND", "numpy")
+# Set CA_BENCHMARK_STEPS to a number of generations to time them without opening a window,
+# e.g. CA_BENCHMARK_STEPS=1000 python python_guide_b8f2c6.py
+BENCHMARK_STEPS = int(os.environ.get("CA_BENCHMARK_STEPS", "0"))
 # Define colors using RGB tuples (Red, Green, Blue).
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -29,117 +61,588 @@ RED = (255, 0, 0)
 
 # --- Cellular Automata Logic ---
 
+# The (row, column) offsets of the 8 neighbors around a cell, in this order:
+# top-left, top, top-right, middle-left, middle-right, bottom-left, bottom, bottom-right.
+NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+# The available ways of computing a generation (see CellularAutomaton.update).
+BACKENDS = ("numpy", "bitpacked", "numba", "cupy")
+
+# --- Rules for Conway's Game of Life ---
+# Game of Life is "outer-totalistic": the next state only depends on the current state
+# and on *how many* neighbors are alive, not on which ones. So instead of listing all
+# 512 neighbor combinations, the whole rule fits in a 2 x 9 table indexed by
+# [current_state, live_neighbor_count] -> next_state. Every entry we don't set is 0 (dead).
+# The table is built once, when the module is loaded, and is the default rule set.
+GOL_LUT = np.zeros((2, 9), dtype=np.uint8)
+GOL_LUT[0, 3] = 1  # Birth: a dead cell with exactly three live neighbours becomes alive.
+GOL_LUT[1, 2] = 1  # Survival: a live cell with two live neighbours stays alive.
+GOL_LUT[1, 3] = 1  # Survival: a live cell with three live neighbours stays alive.
+# Every other live cell dies from underpopulation (< 2 neighbors) or overpopulation (> 3 neighbors).
+# Make the shared table read-only; copy it to experiment with other rules.
+GOL_LUT.setflags(write=False)
+
+# Bit-packed grids store 64 cells per 64-bit word, with the first cell of a word in its lowest bit.
+PACKED_WORD = np.dtype('<u8')
+
+def _half_adder(a, b):
+    """
+    Adds two bit planes, 64 cells at a time. Returns (sum_bit, carry_bit).
+    """
+    return a ^ b, a & b
+
+def _full_adder(a, b, c):
+    """
+    Adds three bit planes, 64 cells at a time. Returns (sum_bit, carry_bit).
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+if njit is not None:
+    # nogil=True lets the compiled function release Python's global interpreter lock,
+    # so several threads can run it at the same time on different CPU cores.
+    @njit(nogil=True, cache=True, boundscheck=False)
+    def _step_numba(padded_grid, next_padded_grid, birth_mask, survival_mask, row_start, row_end):
+        """
+        Computes one generation for grid rows row_start..row_end - 1, compiled to machine code.
+        Both grids include the 1-cell ghost border, which must already be filled in, so
+        the neighbors of cell (r, c) are simply rows r..r+2 and columns c..c+2 of the padded
+        grid. The grid is processed one row at a time, which keeps the three rows being read
+        in the CPU cache; each cell's 8 neighbors are summed directly, so no temporary
+        arrays are created.
+
+        The rule is given as two bit masks: bit n of `birth_mask` is set if a dead cell with
+        n live neighbors becomes alive, and bit n of `survival_mask` if a live cell with n
+        live neighbors stays alive. Shifting a mask instead of looking up a table lets the
+        compiler update many cells at once with SIMD instructions.
+        """
+        width = padded_grid.shape[1] - 2
+        # birth_mask ^ (mask_difference & -state) is birth_mask for dead cells (state 0)
+        # and survival_mask for live cells (state 1, since -1 has every bit set).
+        mask_difference = birth_mask ^ survival_mask
+        for r in range(row_start, row_end):
+            above = padded_grid[r]
+            row = padded_grid[r + 1]
+            below = padded_grid[r + 2]
+            out = next_padded_grid[r + 1]
+            for c in range(width):
+                n = (np.int32(above[c]) + above[c + 1] + above[c + 2]
+                     + row[c] + row[c + 2]
+                     + below[c] + below[c + 1] + below[c + 2])
+                state = np.int32(row[c + 1])
+                out[c + 1] = ((birth_mask ^ (mask_difference & -state)) >> n) & 1
+
+# The "cupy" backend computes a generation with one custom GPU function (a CUDA kernel),
+# run by one GPU thread per cell. Threads are grouped in blocks of GPU_BLOCK_X x GPU_BLOCK_Y
+# cells. Each block first copies its cells plus a 1-cell border into fast shared memory,
+# so every cell is read from the slower main GPU memory only about once per generation.
+GPU_BLOCK_X = 32
+GPU_BLOCK_Y = 8
+
+GPU_STEP_SOURCE = r'''
+#define BLOCK_X %(block_x)d
+#define BLOCK_Y %(block_y)d
+
+extern "C" __global__
+void life_step(const unsigned char* grid, unsigned char* next_grid,
+               const unsigned char* count_lut, int width, int height)
+{
+    __shared__ unsigned char tile[BLOCK_Y + 2][BLOCK_X + 2];
+    int x = blockIdx.x * BLOCK_X + threadIdx.x;
+    int y = blockIdx.y * BLOCK_Y + threadIdx.y;
+
+    // Cooperatively load this block's cells and the 1-cell border around them,
+    // wrapping around the edges of the grid (toroidal).
+    for (int ty = threadIdx.y; ty < BLOCK_Y + 2; ty += BLOCK_Y) {
+        for (int tx = threadIdx.x; tx < BLOCK_X + 2; tx += BLOCK_X) {
+            int gy = (blockIdx.y * BLOCK_Y + ty - 1 + height) %% height;
+            int gx = (blockIdx.x * BLOCK_X + tx - 1 + width) %% width;
+            tile[ty][tx] = grid[gy * width + gx];
+        }
+    }
+    __syncthreads();
+
+    if (x >= width || y >= height) {
+        return;
+    }
+    int tx = threadIdx.x + 1;
+    int ty = threadIdx.y + 1;
+    int n = tile[ty - 1][tx - 1] + tile[ty - 1][tx] + tile[ty - 1][tx + 1]
+          + tile[ty][tx - 1] + tile[ty][tx + 1]
+          + tile[ty + 1][tx - 1] + tile[ty + 1][tx] + tile[ty + 1][tx + 1];
+    // count_lut is the 2 x 9 rule table, indexed by [state, live_neighbor_count].
+    next_grid[y * width + x] = count_lut[tile[ty][tx] * 9 + n];
+}
+''' % {"block_x": GPU_BLOCK_X, "block_y": GPU_BLOCK_Y}
+
+if cp is not None:
+    # The kernel is compiled by CuPy the first time it is launched.
+    _gpu_step = cp.RawKernel(GPU_STEP_SOURCE, "life_step")
+
+# One pool of worker threads shared by every automaton, created the first time it is needed.
+_thread_pool = None
+
+def _get_thread_pool():
+    """
+    Returns the shared thread pool, with one worker per CPU core.
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _thread_pool
+
 class CellularAutomaton:
     """
     Represents a 2D cellular automaton grid.
     Each cell has a state (e.g., 0 for dead, 1 for alive).
     The state of cells evolves over time based on predefined rules.
     """
-    def __init__(self, width, height, rule_set, initial_density=0.5):
+    def __init__(self, width, height, rule_set=None, initial_density=0.5, backend="numpy", seed=None):
         """
         Initializes the cellular automaton grid.
 
         Args:
             width (int): The width of the grid in cells.
             height (int): The height of the grid in cells.
-            rule_set (dict): A dictionary defining the rules for cell evolution.
-                             Keys are tuples representing the state of a cell and its neighbors.
-                             Values are the resulting state of the cell.
+            rule_set (dict or array, optional): The rules for cell evolution, either:
+                             - a 2 x 9 array indexed by [current_state, live_neighbor_count]
+                               whose values are the resulting state of the cell, or
+                             - a dictionary whose keys are tuples representing the state of a
+                               cell and its neighbors, and whose values are the resulting state.
+                             If None, Conway's Game of Life (GOL_LUT) is used.
             initial_density (float): The probability (0.0 to 1.0) that a cell starts as alive.
+            backend (str): How generations are computed. "numpy" works with any rule set;
+                           "bitpacked" stores 64 cells per integer and only supports Game of Life.
+                           "numba" runs a compiled kernel (requires numba) and needs a 2 x 9 rule table.
+                           "cupy" runs on an NVIDIA GPU (requires cupy) and needs a 2 x 9 rule table.
+            seed (int, optional): Seed for the random initial states, to get reproducible patterns.
         """
+        if rule_set is None:
+            rule_set = GOL_LUT
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if backend == "numba" and njit is None:
+            raise ImportError("The 'numba' backend requires numba: pip install numba")
+        if backend == "cupy" and cp is None:
+            raise ImportError("The 'cupy' backend requires cupy: see https://docs.cupy.dev/en/stable/install.html")
         self.width = width
         self.height = height
         self.rule_set = rule_set
+        if isinstance(rule_set, dict):
+            # Flatten the dictionary into a 512-entry lookup table once up front.
+            self.rule_lut = self._build_rule_lut(rule_set)
+            self.count_lut = None
+        else:
+            # A table indexed by [current_state, live_neighbor_count] can be used directly.
+            # Keep a copy, so later changes to the caller's table don't affect this automaton.
+            self.rule_lut = None
+            self.count_lut = np.array(rule_set, dtype=np.uint8)
+            if self.count_lut.shape != (2, 9):
+                raise ValueError(f"A rule table must have shape (2, 9), got {self.count_lut.shape}")
+            if self.count_lut.max() > 1:
+                raise ValueError("A rule table may only contain the states 0 (dead) and 1 (alive)")
+        if backend in ("numba", "cupy") and self.count_lut is None:
+            raise ValueError(f"The {backend!r} backend needs a 2 x 9 rule table, not a rule dictionary")
+        if backend == "bitpacked" and not np.array_equal(self.count_lut, GOL_LUT):
+            raise ValueError("The 'bitpacked' backend only supports Game of Life")
         # Initialize the grid with random states.
-        self.grid = self._initialize_grid(initial_density)
+        # The grid is a 2-D NumPy array of bytes (shape: height x width), so each
+        # cell costs a single byte instead of a full Python int object.
+        # It is stored inside a larger array with a 1-cell "ghost" border all around it.
+        # Before each update the border is filled with copies of the opposite edges, so
+        # every cell's neighbors can be read without any wrap-around arithmetic.
+        self.padded_grid = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self.grid = self.padded_grid[1:-1, 1:-1]
+        # A dedicated random number generator, and a buffer for its numbers, so that
+        # resetting the grid is reproducible and doesn't allocate any new arrays.
+        self.rng = np.random.default_rng(seed)
+        self.random_buffer = np.empty((height, width))
+        self._initialize_grid(initial_density)
         # Store the next state of the grid temporarily during updates.
-        self.next_grid = [[0 for _ in range(width)] for _ in range(height)]
+        # This buffer is allocated once and reused for every generation.
+        self.next_padded_grid = np.zeros_like(self.padded_grid)
+        self.next_grid = self.next_padded_grid[1:-1, 1:-1]
+        # In the padded grid, the neighbor at offset (dr, dc) of every cell is simply the
+        # grid shifted by (dr, dc), which is a plain slice of the padded array.
+        self.neighbor_slices = [(slice(1 + dr, 1 + dr + height), slice(1 + dc, 1 + dc + width))
+                                for dr, dc in NEIGHBOR_OFFSETS]
+        # Scratch space for the live-neighbor count of every cell, also reused every generation.
+        self.neighbor_counts = np.empty_like(self.grid)
+        if backend == "numpy" and self.count_lut is not None:
+            # Write and compile a step function specialized to this rule table and grid size.
+            self.step_source = self._generate_step_source()
+            namespace = {}
+            exec(compile(self.step_source, "<generated step>", "exec"), namespace)
+            self._step = namespace["step"]
+        self.backend = backend
+        if backend == "numba":
+            # The kernel takes the rule as bit masks of neighbor counts (see _step_numba).
+            self.birth_mask = np.int32(sum(1 << n for n in range(9) if self.count_lut[0, n]))
+            self.survival_mask = np.int32(sum(1 << n for n in range(9) if self.count_lut[1, n]))
+            # Split the rows into one horizontal band per CPU core.
+            # Each band only reads the current grid and writes its own rows of the next grid,
+            # so the bands can be updated by different threads without any locking.
+            band_rows = -(-height // (os.cpu_count() or 1))
+            self.row_bands = [(start, min(start + band_rows, height)) for start in range(0, height, band_rows)]
+        if backend == "bitpacked":
+            # The packed grid becomes the real state; self.grid is only refreshed by get_grid().
+            self.grid_packed = self._pack_bits(self.grid)
+            self.next_grid_packed = np.empty_like(self.grid_packed)
+            # Masks out the unused bits at the end of each row when the width is not a multiple of 64.
+            self._row_mask = self._pack_bits(np.ones((1, width), dtype=np.uint8))
+        if backend == "cupy":
+            # The grid lives in GPU memory; self.grid is only refreshed by get_grid(),
+            # so nothing is copied between the GPU and the CPU unless a frame is drawn.
+            # The kernel reads raw memory, so every array must be contiguous (C order).
+            self.device_grid = cp.asarray(np.ascontiguousarray(self.grid))
+            self.device_next_grid = cp.empty_like(self.device_grid)
+            self.device_count_lut = cp.asarray(np.ascontiguousarray(self.count_lut))
+            # One GPU thread per cell: enough blocks to cover the whole grid.
+            self.gpu_blocks = (-(-width // GPU_BLOCK_X), -(-height // GPU_BLOCK_Y))
+
+    @staticmethod
+    def _build_rule_lut(rule_set):
+        """
+        Converts a rule_set dictionary into a flat lookup table with 512 entries.
+
+        Every key (current_state, n1, ..., n8) is encoded as a 9-bit number: the current
+        state is bit 8 and the neighbors n1..n8 are bits 7..0, read like a binary number.
+        The table entry at that number is the cell's next state. Combinations missing
+        from rule_set keep their current state, just like `rule_set.get(key, current_state)`.
+        """
+        # Start with "stay the same": the current state is the top bit of the index.
+        rule_lut = (np.arange(512) >> 8).astype(np.uint8)
+        for (current_state, *neighbor_states), next_state in rule_set.items():
+            # e.g. neighbors (0, 1, 1, 0, 0, 0, 0, 0) -> binary '01100000' -> 96
+            index = current_state << 8 | int(''.join(map(str, neighbor_states)), 2)
+            rule_lut[index] = next_state
+        return rule_lut
+
+    def _pack_bits(self, grid):
+        """
+        Packs a (height, width) grid of 0/1 bytes into (height, ceil(width / 64)) 64-bit words.
+        Cell (r, c) becomes bit (c % 64) of word (r, c // 64).
+        """
+        packed_bytes = np.packbits(grid, axis=1, bitorder='little')
+        # Pad each row to a whole number of 8-byte words before viewing it as 64-bit integers.
+        words = -(-self.width // 64)
+        padded = np.zeros((grid.shape[0], words * 8), dtype=np.uint8)
+        padded[:, :packed_bytes.shape[1]] = packed_bytes
+        return padded.view(PACKED_WORD)
+
+    def _unpack_bits(self, grid_packed, out):
+        """
+        Expands a packed grid back into one byte per cell, writing into `out`.
+        """
+        out[...] = np.unpackbits(grid_packed.view(np.uint8), axis=1, count=self.width, bitorder='little')
+        return out
 
     def _initialize_grid(self, density):
         """
         Fills the grid with initial states, randomly setting cells to alive based on density.
         """
-        grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        for r in range(self.height):
-            for c in range(self.width):
-                if random.random() < density:
-                    grid[r][c] = 1  # 1 represents an "alive" cell.
-        return grid
-
-    def _get_neighbor_states(self, r, c):
-        """
-        Gets the states of the 8 neighbors surrounding a cell at (r, c).
-        Handles boundary conditions by wrapping around the grid (toroidal).
-        """
-        neighbor_states = []
-        # Iterate through relative positions of neighbors (-1, 0, 1 for row and column).
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                # Skip the cell itself.
-                if dr == 0 and dc == 0:
-                    continue
-
-                # Calculate the absolute row and column of the neighbor, wrapping around.
-                # The modulo operator (%) ensures we stay within grid bounds.
-                neighbor_r = (r + dr) % self.height
-                neighbor_c = (c + dc) % self.width
-                neighbor_states.append(self.grid[neighbor_r][neighbor_c])
-        return tuple(neighbor_states) # Return as a tuple for easy lookup in the rule_set.
+        # Draw one random number per cell and mark it alive (1) if it falls below the density.
+        self.rng.random(out=self.random_buffer)
+        np.less(self.random_buffer, density, out=self.grid)
+
+    def reset(self, initial_density=0.5):
+        """
+        Starts over with a new random pattern, reusing the existing grid and rules.
+
+        Args:
+            initial_density (float): The probability (0.0 to 1.0) that a cell starts as alive.
+        """
+        self._initialize_grid(initial_density)
+        if self.backend == "bitpacked":
+            self.grid_packed[...] = self._pack_bits(self.grid)
+        elif self.backend == "cupy":
+            self.device_grid[...] = cp.asarray(self.grid)
 
     def update(self):
         """
         Updates the state of every cell in the grid for the next generation.
         This is the core of the cellular automata simulation.
         """
-        for r in range(self.height):
-            for c in range(self.width):
-                # Get the current state of the cell.
-                current_state = self.grid[r][c]
-                # Get the states of its neighbors.
-                neighbor_states = self._get_neighbor_states(r, c)
-                # Combine the current state with neighbor states to form the lookup key.
-                # The order of states in the tuple is crucial and depends on how rule_set is defined.
-                # Here, we assume the rule_set expects (current_cell_state, neighbor1_state, ..., neighbor8_state).
-                lookup_key = (current_state,) + neighbor_states
+        if self.backend == "bitpacked":
+            # The packed grids have their own pair of buffers to swap.
+            self._update_bit_packed()
+            self.grid_packed, self.next_grid_packed = self.next_grid_packed, self.grid_packed
+            return
+        if self.backend == "cupy":
+            # The GPU grids have their own pair of buffers to swap.
+            self._update_cupy()
+            self.device_grid, self.device_next_grid = self.device_next_grid, self.device_grid
+            return
+
+        self._refresh_ghost_border()
+        if self.backend == "numba":
+            self._update_numba()
+        elif self.count_lut is not None:
+            self._update_from_neighbor_counts()
+        else:
+            self._update_from_rule_set()
 
-                # Apply the rule from the rule_set.
-                # If the rule for this combination exists, use its result; otherwise, the cell stays the same.
-                self.next_grid[r][c] = self.rule_set.get(lookup_key, current_state)
+        # After calculating all next states, swap the two buffers.
+        # The old grid becomes scratch space for the next update, so nothing is copied or reallocated.
+        self.grid, self.next_grid = self.next_grid, self.grid
+        self.padded_grid, self.next_padded_grid = self.next_padded_grid, self.padded_grid
 
-        # After calculating all next states, replace the current grid with the next grid.
-        self.grid = [row[:] for row in self.next_grid] # Create a deep copy to avoid aliasing issues.
+    def _refresh_ghost_border(self):
+        """
+        Fills the 1-cell border around the grid with copies of the opposite edges,
+        so that the grid wraps around (toroidal) when neighbors are read from the border.
+        """
+        padded = self.padded_grid
+        # The row above the top edge is a copy of the bottom row, and vice versa.
+        padded[0, 1:-1] = padded[-2, 1:-1]
+        padded[-1, 1:-1] = padded[1, 1:-1]
+        # The same for the columns. Copying whole columns (including the rows we just
+        # filled) also fills the 4 corners with the diagonally opposite cells.
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+
+    def _update_numba(self):
+        """
+        Computes the next generation into `next_grid` with the compiled kernel,
+        one band of rows per worker thread. The ghost border must already be filled in.
+        """
+        if len(self.row_bands) == 1:
+            # With a single band (one CPU core), handing it to a thread only adds overhead.
+            _step_numba(self.padded_grid, self.next_padded_grid, self.birth_mask, self.survival_mask,
+                        0, self.height)
+            return
+        pool = _get_thread_pool()
+        futures = [pool.submit(_step_numba, self.padded_grid, self.next_padded_grid,
+                               self.birth_mask, self.survival_mask, start, end)
+                   for start, end in self.row_bands]
+        # Wait for every band to finish (re-raising any error) before the buffers are swapped.
+        for future in futures:
+            future.result()
+
+    def _update_cupy(self):
+        """
+        Computes the next generation from `device_grid` into `device_next_grid` on the GPU.
+        Every cell is handled by its own GPU thread, so large grids update in parallel.
+        The whole step (counting neighbors and applying the rule) is a single kernel launch,
+        so no temporary arrays are created.
+        """
+        _gpu_step(self.gpu_blocks, (GPU_BLOCK_X, GPU_BLOCK_Y),
+                  (self.device_grid, self.device_next_grid, self.device_count_lut,
+                   np.int32(self.width), np.int32(self.height)))
+
+    def _generate_step_source(self):
+        """
+        Writes the source code of a `step(padded, out, counts)` function for this rule table.
+
+        Because the rules and the grid size are known once the automaton is created, the
+        generated code can spell them out as constants: the neighbor slices become plain
+        numbers and the rule table becomes a few comparisons, e.g. for Game of Life
+            out[...] = (counts == 3) | ((counts == 2) & alive)
+        so there is no table lookup or loop over the rules left when it runs.
+        Print `automaton.step_source` to see the generated code.
+        """
+        height, width = self.height, self.width
+        births = {n for n in range(9) if self.count_lut[0, n]}
+        survivals = {n for n in range(9) if self.count_lut[1, n]}
+        # Counts that make a cell alive whatever its state don't need to check the state.
+        conditions = [f"(counts == {n})" for n in sorted(births & survivals)]
+        conditions += [f"((counts == {n}) & dead)" for n in sorted(births - survivals)]
+        conditions += [f"((counts == {n}) & alive)" for n in sorted(survivals - births)]
+
+        lines = [
+            "def step(padded, out, counts):",
+            f"    alive = padded[1:{height + 1}, 1:{width + 1}] == 1",
+        ]
+        if births - survivals:
+            lines.append("    dead = ~alive")
+        # With the ghost border in place, each shifted copy of the grid is just a slice
+        # of the padded grid, and the border makes it wrap around at the edges.
+        # Adding up the 8 shifted copies gives each cell's neighbor count.
+        for i, (rows, cols) in enumerate(self.neighbor_slices):
+            operator = "=" if i == 0 else "+="
+            target = "counts[...]" if i == 0 else "counts"
+            lines.append(f"    {target} {operator} padded[{rows.start}:{rows.stop}, {cols.start}:{cols.stop}]")
+        lines.append(f"    out[...] = {' | '.join(conditions) if conditions else '0'}")
+        return "\n".join(lines) + "\n"
+
+    def _update_from_neighbor_counts(self):
+        """
+        Computes the next generation into `next_grid` from the [state, count] rule table.
+        The ghost border must already be filled in.
+        Instead of visiting cells one by one, we count every cell's live neighbors
+        at once by shifting the whole grid, then apply the rules with array operations,
+        using the step function generated for this rule table (see _generate_step_source).
+        """
+        self._step(self.padded_grid, self.next_grid, self.neighbor_counts)
+
+    def _update_bit_packed(self):
+        """
+        Computes the next generation of Game of Life from `grid_packed` into `next_grid_packed`.
+        Each 64-bit word holds 64 cells, so every bitwise operation below updates 64 cells at once.
+        The 8 neighbor counts are added with binary adder logic, one bit of the count at a time.
+        """
+        g = self.grid_packed
+        last_bit = (self.width - 1) % 64
+        one = PACKED_WORD.type(1)
+
+        # Left neighbors: cell c sees cell c - 1, so shift every bit up by one and carry in
+        # the top bit of the previous word. Column 0 wraps around to the last column.
+        left = (g << one) | (np.roll(g, 1, axis=1) >> PACKED_WORD.type(63))
+        left[:, 0] = (left[:, 0] & ~one) | ((g[:, -1] >> PACKED_WORD.type(last_bit)) & one)
+        # Right neighbors: cell c sees cell c + 1. The last column wraps around to column 0.
+        right = (g >> one) | (np.roll(g, -1, axis=1) << PACKED_WORD.type(63))
+        last_bit_mask = one << PACKED_WORD.type(last_bit)
+        right[:, -1] = (right[:, -1] & ~last_bit_mask) | ((g[:, 0] & one) << PACKED_WORD.type(last_bit))
+
+        # The rows above and below come from rolling whole rows, which wrap the same way.
+        planes = [np.roll(left, 1, axis=0), np.roll(g, 1, axis=0), np.roll(right, 1, axis=0),
+                  left, right,
+                  np.roll(left, -1, axis=0), np.roll(g, -1, axis=0), np.roll(right, -1, axis=0)]
+
+        # Add up the 8 neighbor planes into a 3-bit count (b2 b1 b0). A count of 8 wraps to 0,
+        # which is fine because both mean the cell is dead in the next generation.
+        s0, c0 = _full_adder(planes[0], planes[1], planes[2])
+        s1, c1 = _full_adder(planes[3], planes[4], planes[5])
+        s2, c2 = _half_adder(planes[6], planes[7])
+        b0, c3 = _full_adder(s0, s1, s2)
+        t0, t1 = _full_adder(c0, c1, c2)
+        b1, t2 = _half_adder(t0, c3)
+        b2 = t1 ^ t2
+
+        # Alive next generation: count is 3 (011), or count is 2 (010) and the cell is alive.
+        np.bitwise_and(b1 & ~b2 & (b0 | g), self._row_mask, out=self.next_grid_packed)
+
+    def _update_from_rule_set(self):
+        """
+        Computes the next generation into `next_grid` by looking up every cell in the rule table.
+        The ghost border must already be filled in.
+        Each cell's state and its 8 neighbors are packed into a 9-bit number (see
+        _build_rule_lut), so the lookup for the whole grid is a single array indexing step.
+        """
+        # Start with the current state in bit 8, using 16-bit integers so 9 bits fit.
+        index = self.grid.astype(np.uint16) << 8
+        # Take the grid shifted once per neighbor (wrapping around through the ghost border) and
+        # place that neighbor's state in its bit: the first neighbor (top-left) is bit 7, the last is bit 0.
+        for bit, neighbor_slice in zip(range(7, -1, -1), self.neighbor_slices):
+            index |= self.padded_grid[neighbor_slice].astype(np.uint16) << bit
+        # Apply the rule to every cell at once.
+        self.next_grid[...] = self.rule_lut[index]
 
     def get_grid(self):
         """
         Returns the current state of the grid.
         """
+        if self.backend == "bitpacked":
+            return self._unpack_bits(self.grid_packed, self.grid)
+        if self.backend == "cupy":
+            # Copy the grid from GPU memory back to the CPU, e.g. to draw it.
+            self.grid[...] = cp.asnumpy(self.device_grid)
         return self.grid
 
 # --- Drawing Functions ---
 
-def draw_grid(screen, grid, cell_size):
+# The color of each cell state, indexed by state: 0 is dead (black), 1 is alive (green).
+# The remaining entries of the 256-color palette are never used.
+CELL_PALETTE = [BLACK, GREEN] + [BLACK] * 254
+
+class GridRenderer:
     """
-    Draws the cellular automaton grid onto the Pygame screen.
-    Each cell is drawn as a rectangle.
+    Draws a cellular automaton grid onto the Pygame screen.
+    The grid is copied into a small 8-bit image with one pixel per cell, whose palette
+    turns each cell state into its color. That image is then scaled up so each pixel
+    covers a cell_size x cell_size square. All surfaces are created once and reused.
+
+    After a few generations most cells stop changing (still lifes, oscillators), so the
+    renderer remembers the last grid it drew and, when only a few cells changed, just
+    repaints those cells instead of the whole image.
     """
-    # Iterate through each row and column of the grid.
-    for r, row in enumerate(grid):
-        for c, cell_state in enumerate(row):
-            # Determine the color based on the cell's state.
-            color = BLACK if cell_state == 0 else GREEN # 0 is dead (black), 1 is alive (green).
+    # Above this many changed cells, redrawing the whole image is faster than
+    # repainting the changed cells one by one.
+    MAX_DELTA_CELLS = 400
 
-            # Calculate the pixel coordinates for the top-left corner of the cell rectangle.
-            x_pos = c * cell_size
-            y_pos = r * cell_size
+    def __init__(self, width, height, cell_size):
+        """
+        Creates the surfaces used for drawing.
 
-            # Create a rectangle representing the cell.
-            cell_rect = pygame.Rect(x_pos, y_pos, cell_size, cell_size)
+        Args:
+            width (int): The width of the grid in cells.
+            height (int): The height of the grid in cells.
+            cell_size (int): The size of each cell on screen, in pixels.
+        """
+        # One byte per pixel: the pixel value is the cell state, the palette gives its color.
+        self.small_surface = pygame.Surface((width, height), depth=8)
+        self.small_surface.set_palette(CELL_PALETTE)
+        # pygame.transform.scale can only write into a surface of the same format,
+        # so the scaled-up image is also an 8-bit surface with the same palette.
+        self.scaled_surface = pygame.Surface((width * cell_size, height * cell_size), depth=8)
+        self.scaled_surface.set_palette(CELL_PALETTE)
+        self.cell_size = cell_size
+        # The grid as it was last drawn on screen (None until the first full draw).
+        self.drawn_grid = None
+
+    def draw(self, screen, grid):
+        """
+        Draws the grid onto the screen.
+        Assumes nothing else has drawn over the grid since the previous call.
+        """
+        if self.drawn_grid is not None:
+            # Find the (row, column) of every cell that changed since the last frame.
+            changed = np.argwhere(grid != self.drawn_grid)
+            if len(changed) <= self.MAX_DELTA_CELLS:
+                self._draw_changed_cells(screen, grid, changed)
+                return
+        self._draw_full(screen, grid)
+
+    def _draw_changed_cells(self, screen, grid, changed):
+        """
+        Repaints only the given cells, each as a cell_size x cell_size square.
+        """
+        size = self.cell_size
+        for r, c in changed.tolist():
+            state = grid[r, c]
+            screen.fill(CELL_PALETTE[state], (c * size, r * size, size, size))
+            self.drawn_grid[r, c] = state
 
-            # Draw the rectangle onto the screen.
-            pygame.draw.rect(screen, color, cell_rect)
+    def _draw_full(self, screen, grid):
+        """
+        Redraws the whole grid from the paletted image.
+        """
+        # pixels2d gives direct access to the surface's pixels, without copying them.
+        # Pygame surfaces are indexed [x, y] (column first), while our grid is
+        # [row, column], so we write the transposed grid.
+        pixels = pygame.surfarray.pixels2d(self.small_surface)
+        pixels[...] = grid.T
+        # The surface stays locked while a pixel view exists, so release it before scaling.
+        del pixels
+        pygame.transform.scale(self.small_surface, self.scaled_surface.get_size(), self.scaled_surface)
+        # Copy the whole image onto the screen in a single blit.
+        screen.blit(self.scaled_surface, (0, 0))
+        if self.drawn_grid is None:
+            self.drawn_grid = grid.copy()
+        else:
+            self.drawn_grid[...] = grid
 
 # --- Example Usage ---
 
+def run_benchmark(steps):
+    """
+    Times `steps` generations of the automaton used by main(), without any drawing,
+    event handling or frame rate limit, and prints the average time per generation.
+    """
+    grid_width = SCREEN_WIDTH // CELL_SIZE
+    grid_height = SCREEN_HEIGHT // CELL_SIZE
+    automaton = CellularAutomaton(grid_width, grid_height, GOL_LUT, initial_density=0.3, backend=BACKEND)
+    # Run one generation first, so one-time costs (like compiling the numba kernel) aren't timed.
+    automaton.update()
+    start = time.perf_counter()
+    for _ in range(steps):
+        automaton.update()
+    # Reading the grid waits for any unfinished work (e.g. on the GPU) to complete.
+    automaton.get_grid()
+    elapsed = time.perf_counter() - start
+    print(f"{BACKEND}: {steps} generations of {grid_width}x{grid_height} cells "
+          f"in {elapsed:.3f} s ({elapsed / steps * 1000:.3f} ms per generation)")
+
 def main():
     """
     The main function to set up Pygame, create the cellular automaton,
@@ -156,192 +659,17 @@ def main():
 
     # --- Define a rule set for Conway's Game of Life ---
     # This is a famous example of a cellular automaton.
-    # Rules are based on the current state of a cell and its 8 neighbors.
-    # A cell is alive (1) if it has exactly 3 live neighbors.
-    # A live cell with fewer than 2 live neighbors dies (underpopulation).
-    # A live cell with more than 3 live neighbors dies (overpopulation).
-    # A dead cell with exactly 3 live neighbors becomes alive (reproduction).
-    # The structure: (current_state, n1, n2, n3, n4, n5, n6, n7, n8) -> next_state
-
-    # Define the default rule for a dead cell (state 0)
-    # If a dead cell has 3 live neighbors, it becomes alive.
-    RULE_DEAD_TO_ALIVE = {
-        (0, 0, 0, 0, 0, 0, 0, 0, 0): 0, # 0 neighbors -> stays dead
-        (0, 1, 0, 0, 0, 0, 0, 0, 0): 0, # 1 neighbor -> stays dead
-        (0, 1, 1, 0, 0, 0, 0, 0, 0): 1, # 2 neighbors -> becomes alive (reproduction rule)
-        (0, 1, 1, 1, 0, 0, 0, 0, 0): 1, # 3 neighbors -> becomes alive (reproduction rule)
-        (0, 1, 1, 1, 1, 0, 0, 0, 0): 0, # 4 neighbors -> dies
-        (0, 1, 1, 1, 1, 1, 0, 0, 0): 0, # 5 neighbors -> dies
-        (0, 1, 1, 1, 1, 1, 1, 0, 0): 0, # 6 neighbors -> dies
-        (0, 1, 1, 1, 1, 1, 1, 1, 0): 0, # 7 neighbors -> dies
-        (0, 1, 1, 1, 1, 1, 1, 1, 1): 0, # 8 neighbors -> dies
-    }
-
-    # Define the default rule for a live cell (state 1)
-    # If a live cell has 2 or 3 live neighbors, it stays alive.
-    # Otherwise, it dies.
-    RULE_ALIVE_TO_ALIVE = {
-        (1, 0, 0, 0, 0, 0, 0, 0, 0): 0, # 0 neighbors -> dies (underpopulation)
-        (1, 1, 0, 0, 0, 0, 0, 0, 0): 0, # 1 neighbor -> dies (underpopulation)
-        (1, 1, 1, 0, 0, 0, 0, 0, 0): 1, # 2 neighbors -> stays alive
-        (1, 1, 1, 1, 0, 0, 0, 0, 0): 1, # 3 neighbors -> stays alive (survival rule)
-        (1, 1, 1, 1, 1, 0, 0, 0, 0): 0, # 4 neighbors -> dies (overpopulation)
-        (1, 1, 1, 1, 1, 1, 0, 0, 0): 0, # 5 neighbors -> dies (overpopulation)
-        (1, 1, 1, 1, 1, 1, 1, 0, 0): 0, # 6 neighbors -> dies (overpopulation)
-        (1, 1, 1, 1, 1, 1, 1, 1, 0): 0, # 7 neighbors -> dies (overpopulation)
-        (1, 1, 1, 1, 1, 1, 1, 1, 1): 0, # 8 neighbors -> dies (overpopulation)
-    }
-
-    # Combine the rules. This dictionary will be passed to the CellularAutomaton.
-    # Note: The order of neighbor states matters. The keys are:
-    # (current_cell_state, top_left, top, top_right, middle_left, middle_right, bottom_left, bottom, bottom_right)
-    # However, in _get_neighbor_states, we collect them in a fixed order.
-    # Let's ensure consistency. A common order for neighbors is clockwise starting from top-left.
-    # Our _get_neighbor_states produces: top-left, top, top-right, middle-left, middle-right, bottom-left, bottom, bottom-right.
-    # So the keys are (current_state, tl, t, tr, ml, mr, bl, b, br)
-
-    # We need to map the generated neighbor tuple from _get_neighbor_states to the rule_set keys.
-    # Let's redefine the rule_set structure to match our _get_neighbor_states output directly.
-    # A rule is defined by (current_state, neighbor_states_tuple) -> next_state
-
-    # Example: A dead cell (0) with 3 live neighbors becomes alive (1).
-    # The tuple for neighbors is generated by _get_neighbor_states.
-    # We need to ensure the neighbor_states tuple from _get_neighbor_states
-    # matches the structure expected by the rule_set.
-    # _get_neighbor_states provides: (tl, t, tr, ml, mr, bl, b, br)
-
-    # Let's adjust the rules to be more direct and cover all combinations.
-    # This is where the "randomness" and "evolving" aspect comes in.
-    # We can create different rule sets to get different patterns.
-
-    # For simplicity, let's define rules for specific neighbor counts.
-    # This is a simplified representation. A true Game of Life rule set would be exhaustive.
-
-    # A more compact rule representation for Game of Life:
-    # For a cell to be alive in the next generation:
-    # 1. It must be currently alive and have 2 or 3 live neighbors.
-    # 2. It must be currently dead and have exactly 3 live neighbors.
-
-    # Let's build the rule_set based on neighbor counts.
-    game_of_life_rules = {}
-    # Live cell rules:
-    # Current state is 1.
-    for num_live_neighbors in range(9): # 0 to 8 neighbors
-        # The rule depends on the number of live neighbors.
-        # This part is tricky to map directly from a simple count.
-        # The actual rule_set dictionary requires specific neighbor states.
-
-        # Let's simplify and focus on a different type of evolving pattern
-        # that is easier to define rules for initially.
-        # Instead of Game of Life, let's create a custom rule.
-
-        # Custom Rule Idea:
-        # A cell becomes alive if it has at least one alive neighbor.
-        # A live cell dies if it has more than 3 alive neighbors.
-        # Otherwise, states persist.
-
-        # Let's define a simpler rule set for a more abstract pattern.
-        # Rule: A cell's next state is the XOR of its current state and a random
-        #       neighbor's state. This will lead to complex, chaotic patterns.
-
-        # Re-thinking the rule_set structure for clarity and learning.
-        # The key will be (current_cell_state,) + neighbor_states_tuple
-        # The neighbor_states_tuple from _get_neighbor_states is (tl, t, tr, ml, mr, bl, b, br)
-
-    # Let's define a rule where a cell becomes alive if it has an ODD number of alive neighbors.
-    # This is related to Rule 90 in Wolfram's 1D cellular automata, adapted to 2D.
-    # Let's use a simpler rule:
-    # - If a cell is dead (0) and has exactly 2 alive neighbors, it becomes alive (1).
-    # - If a cell is alive (1) and has 1, 2, or 3 alive neighbors, it stays alive (1).
-    # - All other cases, the cell becomes dead (0).
-
-    # Constructing a rule_set for this custom logic:
-    custom_rules = {}
-    for r in range(self.height if 'self' in locals() else 10): # Mocking for rule generation
-        for c in range(self.width if 'self' in locals() else 10): # Mocking
-            for num_neighbors_alive in range(9):
-                # Generate all possible neighbor state combinations for a given number of live neighbors
-                # This is computationally intensive to do explicitly.
-                # Let's focus on the rule logic itself.
-
-                # A cell's next state depends on its current state and its neighbors.
-                # We can define rules by iterating through all 9 possibilities (current state + 8 neighbors).
-                # Total states = 2 (current) * 2^8 (neighbors) = 2 * 256 = 512 combinations.
-
-                # Simplified custom rule:
-                # A cell becomes alive (1) if its state XORed with the sum of its neighbors' states is 1.
-                # This will be quite chaotic.
-
-                # Let's simplify rule definition for educational purposes.
-                # We'll focus on a rule where the next state is determined by the majority state of neighbors.
-                # If a dead cell has more than 4 live neighbors, it becomes alive.
-                # If a live cell has less than 3 live neighbors, it dies.
-                # Otherwise, it keeps its state.
-
-                # This requires counting live neighbors, not just matching a specific tuple.
-                # Let's stick to the tuple matching for direct learning of rule_set.
-
-                # Rule Set for Learning:
-                # Rule 1: A dead cell (0) becomes alive (1) if it has exactly one alive neighbor.
-                # Rule 2: A live cell (1) becomes dead (0) if it has more than three alive neighbors.
-                # Rule 3: All other cells remain in their current state.
-
-                # Implementing Rule 1:
-                # We need to iterate through all possible neighbor states that sum to 1.
-                # Example: (0, 1, 0, 0, 0, 0, 0, 0, 0) -> 1
-                #           (0, 0, 1, 0, 0, 0, 0, 0, 0) -> 1
-                # ... and so on for all 8 neighbors.
-
-                # This suggests we need to generate neighbor combinations.
-                # A simpler approach for learning is to specify a few key rules.
-
-    # Let's define a rule set that produces interesting, non-trivial patterns.
-    # Focus on the concept of state transitions based on neighbors.
-    # Consider a simplified rule:
-    # - A dead cell becomes alive if exactly two of its neighbors are alive.
-    # - A live cell stays alive if two or three of its neighbors are alive.
-    # - Otherwise, cells become dead.
-
-    # This is very close to Conway's Game of Life.
-    # Let's define the rule_set structure and populate it.
-
-    # The structure of the keys in rule_set:
-    # (current_cell_state, neighbor1, neighbor2, ..., neighbor8)
-    # The order of neighbors is consistent with self._get_neighbor_states() output:
-    # (top_left, top, top_right, middle_left, middle_right, bottom_left, bottom, bottom_right)
-
-    # Let's define rules for Game of Life (a common and illustrative CA)
     # Birth: A dead cell with exactly three live neighbours becomes a live cell.
     # Survival: A live cell with two or three live neighbours survives.
     # Death:
     #   - Underpopulation: A live cell with fewer than two live neighbours dies.
     #   - Overpopulation: A live cell with more than three live neighbours dies.
-
-    rules_for_game_of_life = {}
-
-    # Generate all 2^8 = 256 possible neighbor states
-    for i in range(256):
-        binary_repr = bin(i)[2:].zfill(8) # Get binary string, pad to 8 digits
-        neighbors = tuple(int(bit) for bit in binary_repr) # Convert bits to integer tuple
-
-        # --- Rules for a DEAD cell (current_state = 0) ---
-        # Birth: A dead cell with exactly three live neighbours becomes a live cell.
-        live_neighbor_count = sum(neighbors)
-        if live_neighbor_count == 3:
-            rules_for_game_of_life[(0,) + neighbors] = 1 # Becomes alive
-
-        # --- Rules for a LIVE cell (current_state = 1) ---
-        # Survival: A live cell with two or three live neighbours survives.
-        if live_neighbor_count == 2 or live_neighbor_count == 3:
-            rules_for_game_of_life[(1,) + neighbors] = 1 # Stays alive
-        else:
-            # Death: Underpopulation ( < 2 neighbors) or Overpopulation ( > 3 neighbors)
-            rules_for_game_of_life[(1,) + neighbors] = 0 # Dies
-
-    # Now, `rules_for_game_of_life` contains the complete set of rules for Conway's Game of Life.
-    # This dictionary can have up to 512 entries, but many will map to staying the same state.
-    # For cells where the outcome isn't explicitly defined by the rules above, they remain in their current state.
-    # The `.get(key, current_state)` in `CellularAutomaton.update` handles this.
+    # These rules are stored in the 2 x 9 table GOL_LUT at the top of this file.
+    #
+    # Rules that depend on *which* neighbors are alive can instead be given as a dictionary
+    # mapping (current_state, top_left, top, top_right, middle_left, middle_right,
+    # bottom_left, bottom, bottom_right) -> next_state, in the same neighbor order as
+    # NEIGHBOR_OFFSETS.
 
     # --- Instantiate the Cellular Automaton ---
     # Calculate grid dimensions based on screen size and cell size.
@@ -351,7 +679,11 @@ def main():
     # Create an instance of our CellularAutomaton.
     # We'll use a low initial density so patterns can emerge more clearly.
     # If density is too high, the grid might just become solid quickly.
-    automaton = CellularAutomaton(grid_width, grid_height, rules_for_game_of_life, initial_density=0.3)
+    automaton = CellularAutomaton(grid_width, grid_height, GOL_LUT, initial_density=0.3, backend=BACKEND)
+    # The renderer keeps its drawing surfaces between frames, so create it only once.
+    renderer = GridRenderer(grid_width, grid_height, CELL_SIZE)
+    # Clear the screen once. The renderer only repaints cells that change after that.
+    screen.fill(BLACK)
 
     # --- Main Game Loop ---
     running = True
@@ -365,41 +697,44 @@ def main():
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     print("Resetting pattern...")
-                    # Re-initialize with a new random seed (or same, to see it evolve differently)
-                    automaton = CellularAutomaton(grid_width, grid_height, rules_for_game_of_life, initial_density=random.uniform(0.2, 0.4))
+                    # Re-initialize the same automaton with a new random pattern and density.
+                    automaton.reset(initial_density=random.uniform(0.2, 0.4))
 
 
         # --- Update ---
-        # Advance the simulation by one step.
-        automaton.update()
+        # Advance the simulation by STEPS_PER_FRAME steps.
+        for _ in range(STEPS_PER_FRAME):
+            automaton.update()
 
         # --- Drawing ---
-        # Fill the screen with black to clear the previous frame.
-        screen.fill(BLACK)
         # Draw the current state of the grid onto the screen.
-        draw_grid(screen, automaton.get_grid(), CELL_SIZE)
+        renderer.draw(screen, automaton.get_grid())
 
         # --- Display Update ---
         # Update the full display Surface to the screen.
         pygame.display.flip()
 
         # --- Frame Rate Control ---
-        # Limit the frame rate to 30 frames per second.
-        # This controls the speed of the pattern evolution.
-        clock.tick(30)
+        # Limit the frame rate to FRAME_RATE frames per second.
+        # Together with STEPS_PER_FRAME, this controls the speed of the pattern evolution.
+        clock.tick(FRAME_RATE)
 
     # Quit Pygame when the loop ends.
     pygame.quit()
 
 # --- Entry Point ---
-# This ensures that the `main()` function is called only when the script is executed directly.
+# This ensures that `main()` (or the benchmark, if CA_BENCHMARK_STEPS is set) only runs
+# when the script is executed directly.
 if __name__ == "__main__":
-    main()
+    if BENCHMARK_STEPS > 0:
+        run_benchmark(BENCHMARK_STEPS)
+    else:
+        main()
 
 # --- Example Usage Explanation ---
 # To run this program:
 # 1. Save the code as a Python file (e.g., `evolving_patterns.py`).
-# 2. Make sure you have `pygame` installed (`pip install pygame`).
+# 2. Make sure you have `pygame` and `numpy` installed (`pip install pygame numpy`).
 # 3. Run the file from your terminal: `python evolving_patterns.py`
 #
 # You will see a window with a black background. Initially, it will be filled
@@ -415,7 +750,7 @@ if __name__ == "__main__":
 # instance in the `main()` function to see how it affects the initial state and
 # subsequent evolution.
 #
-# Try experimenting with different `rules_for_game_of_life` definitions.
+# Try experimenting with different rule tables (start from a copy of `GOL_LUT`).
 # You can create entirely new behaviors by defining different rules for
 # how cells change based on their neighbors! For instance, change the birth
 # and survival conditions.
@@ -439,4 +774,3 @@ if __name__ == "__main__":
 # - Implementing more complex rule sets.
 #
 # Enjoy exploring the emergent beauty of algorithms and randomness!
-"""
\ No newline at end of file